@@ -2,17 +2,13 @@
 Basic Agent Example
 
 This example demonstrates how to use the MCP Agent programmatically.
+Requires the package to be installed (pip install -e .).
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from mcp_agent import MCPAgent, AgentConfig, LLMProvider
-from config import get_config
+from mcp_agent.service_config import get_config
 
 # Initialize configuration
 config = get_config()
@@ -29,30 +25,29 @@ async def main():
         api_key=config.ANTHROPIC_API_KEY
     )
 
-    # Initialize agent
-    agent = MCPAgent(agent_config)
-
-    # Discover available tools
-    print("Discovering tools...")
-    await agent.discover_tools()
+    # Initialize agent (closes its HTTP client on exit)
+    async with MCPAgent(agent_config) as agent:
+        # Discover available tools
+        print("Discovering tools...")
+        await agent.discover_tools()
 
-    print("\nAvailable tools:")
-    for tool_name, description in agent.get_available_tools().items():
-        print(f"  - {tool_name}: {description}")
+        print("\nAvailable tools:")
+        for tool_name, description in agent.get_available_tools().items():
+            print(f"  - {tool_name}: {description}")
 
-    # Run a query
-    user_id = "+919916103095"
-    query = "Get car details for +919916103095"
+        # Run a query
+        user_id = "+919916103095"
+        query = "Get car details for +919916103095"
 
-    print(f"\n{'=' * 60}")
-    print(f"Running query: {query}")
-    print(f"{'=' * 60}\n")
+        print(f"\n{'=' * 60}")
+        print(f"Running query: {query}")
+        print(f"{'=' * 60}\n")
 
-    result = await agent.run(user_id, query, verbose=True)
+        result = await agent.run(user_id, query, verbose=True)
 
-    print(f"\n{'=' * 60}")
-    print(f"Result: {result}")
-    print(f"{'=' * 60}\n")
+        print(f"\n{'=' * 60}")
+        print(f"Result: {result}")
+        print(f"{'=' * 60}\n")
 
 
 if __name__ == "__main__":
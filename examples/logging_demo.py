@@ -3,15 +3,11 @@ Logging Demo - Shows how to use the standard Python logging in this project.
 
 Example output:
   Console: 2026-01-14 18:00:00 - PID:12345 - my_module - INFO - This is an info message
-  File:    2026-01-14 18:00:00 - PID:12345 - my_module - INFO - main:10 - This is an info message
+  File:    2026-01-14 18:00:00 - PID:12345 - my_module - INFO - This is an info message
+  Debug:   2026-01-14 18:00:00 - PID:12345 - my_module - INFO - main:10 - This is an info message
+           (mcp_agent.debug.log, only written when LOG_DEBUG_FILE=1)
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from mcp_agent.llogger import setup_logger
 
 
@@ -20,7 +16,7 @@ def main():
     logger = setup_logger("my_module", level="DEBUG")
 
     # Use different log levels
-    logger.debug("This is a debug message (only in file)")
+    logger.debug("This is a debug message (only in the debug file)")
     logger.info("This is an info message (console + file)")
     logger.warning("This is a warning message")
     logger.error("This is an error message")
@@ -36,7 +32,8 @@ def main():
     except Exception as e:
         logger.exception("An error occurred")  # Includes stack trace
 
-    print("\n✅ Check 'mcp_agent.log' for detailed logs with function names and line numbers")
+    print("\n✅ Check 'mcp_agent.log' for the logs; run with LOG_DEBUG_FILE=1 for "
+          "'mcp_agent.debug.log' with function names and line numbers")
 
 
 if __name__ == "__main__":
@@ -3,22 +3,40 @@
 import httpx
 import json
 import asyncio
-import requests
+import hashlib
 import os
-from anthropic import Anthropic
-from openai import OpenAI
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+from typing import Optional, List, Dict, Any, Tuple
 import logging
+from platformdirs import user_cache_dir
 
-from .config import AgentConfig
+from .config import AgentConfig, init_logging
 from .providers import LLMProvider
 from .llogger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Prefer orjson on the tool-call path; fall back to stdlib json if missing
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    _json_loads = json.loads
+
 
 class MCPAgent:
     """Agent that connects LLMs to MCP tools"""
+
+    _LOGGING_INITED = False  # init_logging() runs for the first agent only
     
     def __init__(self, config: Optional[AgentConfig] = None):
         """
@@ -27,10 +45,17 @@ class MCPAgent:
         Args:
             config: AgentConfig instance. If None, uses defaults.
         """
+        if not MCPAgent._LOGGING_INITED:
+            init_logging()
+            MCPAgent._LOGGING_INITED = True
+
         self.config = config or AgentConfig()
         self.tools = []
         self.tool_registry = {}  # ← NEW: Cache tool endpoints
         self.tools_discovered = False  # ← NEW: Track discovery state
+        self._endpoint_for = {}  # tool name -> (endpoint, call type) for the config defaults
+        self._anthropic_tools = []  # Provider-shaped tool lists, built by discover_tools
+        self._openai_tools = []
         
         logger.info(f"Initializing MCPAgent with provider: {self.config.provider}")
 
@@ -44,7 +69,8 @@ class MCPAgent:
             self.api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
             if not self.api_key:
                 raise ValueError("ANTHROPIC_API_KEY must be set for Anthropic provider")
-            self.anthropic_client = Anthropic(api_key=self.api_key)
+            # The SDK keeps its own transport; the shared pool is for MCP/Ollama only
+            self.anthropic_client = AsyncAnthropic(api_key=self.api_key)
             logger.info(f"Using Anthropic with model: {self.model}")
 
         elif self.config.provider == LLMProvider.OPENAI:
@@ -52,11 +78,34 @@ class MCPAgent:
             self.api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
             if not self.api_key:
                 raise ValueError("OPENAI_API_KEY must be set for OpenAI provider")
-            self.openai_client = OpenAI(api_key=self.api_key)
+            self.openai_client = AsyncOpenAI(api_key=self.api_key)
             logger.info(f"Using OpenAI with model: {self.model}")
 
         else:
             raise ValueError(f"Unknown provider: {self.config.provider}")
+
+        # HTTP client for MCP/Ollama calls: the caller's shared pool if given,
+        # otherwise one owned by this agent so calls still reuse keep-alive connections
+        self._owns_http = self.config.http_client is None
+        self._http = self.config.http_client or httpx.AsyncClient(
+            timeout=self.config.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+
+    async def aclose(self):
+        """Close the HTTP clients this agent owns; a shared http_client is left open"""
+        if self._owns_http:
+            await self._http.aclose()
+        if self.config.provider == LLMProvider.ANTHROPIC:
+            await self.anthropic_client.close()
+        elif self.config.provider == LLMProvider.OPENAI:
+            await self.openai_client.close()
+
+    async def __aenter__(self) -> "MCPAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     async def discover_tools(self) -> List[Dict]:
         """
@@ -70,29 +119,48 @@ class MCPAgent:
         logger.info(f"Discovering tools from {self.config.mcp_server_url}")
         
         try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(
-                    f"{self.config.mcp_server_url}/tools",
-                    timeout=self.config.timeout
-                )
+            # Conditional GET against the on-disk catalog from a previous run
+            cached = self._load_tools_cache()
+            headers = {"If-None-Match": cached["etag"]} if cached else None
+
+            response = await self._http.get(
+                f"{self.config.mcp_server_url}/tools",
+                headers=headers,
+                timeout=self.config.timeout
+            )
+            if response.status_code == 304 and cached:
+                logger.info("Tool catalog unchanged, using disk cache")
+                self.tools = cached["tools"]
+            else:
                 response.raise_for_status()
-                self.tools = response.json()
+                self.tools = _json_loads(response.content)
+                self._save_tools_cache(response.headers.get("etag"))
             
             # Build tool registry with direct endpoints
-            for tool in self.tools:
-                tool_name = tool.get('function', {}).get('name')
-                if tool_name:
-                    self.tool_registry[tool_name] = {
-                        "description": tool.get('function', {}).get('description'),
-                        "parameters": tool.get('function', {}).get('parameters'),
-                        "direct_endpoint": tool.get('function', {}).get('direct_endpoint'),
-                        "proxy_endpoint": f"{self.config.mcp_server_url}/tools/{tool_name}"
-                    }
-                    logger.info(f"Discovered tool: {tool_name}")
-                    if self.tool_registry[tool_name]["direct_endpoint"]:
-                        logger.debug(f"  Direct: {self.tool_registry[tool_name]['direct_endpoint']}")
-                    logger.debug(f"  Proxy:  {self.tool_registry[tool_name]['proxy_endpoint']}")
+            base = self.config.mcp_server_url
+            self.tool_registry = {
+                (func := tool["function"])["name"]: {
+                    "description": func.get("description"),
+                    "parameters": func.get("parameters"),
+                    "direct_endpoint": func.get("direct_endpoint"),
+                    "proxy_endpoint": f"{base}/tools/{func['name']}"
+                }
+                for tool in self.tools if tool.get("function", {}).get("name")
+            }
+            logger.info(f"Discovered tools: {', '.join(self.tool_registry)}")
+            logger.debug(f"Tool registry: {self.tool_registry}")
+
+            # Resolve the default route of every tool once
+            self._endpoint_for = {
+                name: self._resolve_endpoint(name, info, self.config.use_direct_tool_calls)
+                for name, info in self.tool_registry.items()
+            }
             
+            # Only the active provider's view of the tools is ever sent
+            if self.config.provider == LLMProvider.ANTHROPIC:
+                self._anthropic_tools = self._convert_tools_for_anthropic()
+            elif self.config.provider == LLMProvider.OPENAI:
+                self._openai_tools = self._convert_tools_for_openai()
             self.tools_discovered = True
             logger.info(f"Total tools discovered: {len(self.tool_registry)}")
             return self.tools
@@ -101,6 +169,44 @@ class MCPAgent:
             logger.error(f"Failed to discover tools: {e}")
             raise
 
+    def _tools_cache_path(self) -> Path:
+        """Per-server location of the persisted tool catalog"""
+        key = hashlib.sha256(self.config.mcp_server_url.encode()).hexdigest()[:16]
+        return Path(user_cache_dir("mcp_agent")) / f"tools-{key}.json"
+
+    def _load_tools_cache(self) -> Optional[Dict]:
+        """Return the cached {"etag", "tools"} entry, or None if unusable"""
+        if not self.config.cache_tools:
+            return None
+        try:
+            cached = _json_loads(self._tools_cache_path().read_bytes())
+            if not (
+                isinstance(cached, dict)
+                and cached.get("etag")
+                and isinstance(cached.get("tools"), list)
+                and all(isinstance(tool, dict) for tool in cached["tools"])
+            ):
+                raise ValueError("unexpected cache layout")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tools cache: {e}")
+            return None
+        return cached
+
+    def _save_tools_cache(self, etag: Optional[str]):
+        """Persist the current catalog so the next start can revalidate it"""
+        if not self.config.cache_tools or not etag:
+            return
+        path = self._tools_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(_json_dumps({"etag": etag, "tools": self.tools}))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write tools cache {path}: {e}")
+
     async def invoke_tool(
         self, 
         tool_name: str, 
@@ -120,53 +226,32 @@ class MCPAgent:
         if not self.tools_discovered:
             await self.discover_tools()
         
-        # Check if tool exists
-        if tool_name not in self.tool_registry:
+        # Look up the precomputed route, resolving it only for explicit overrides
+        if use_direct is None:
+            route = self._endpoint_for.get(tool_name)
+        else:
+            tool_info = self.tool_registry.get(tool_name)
+            route = tool_info and self._resolve_endpoint(tool_name, tool_info, use_direct)
+
+        if route is None:
             raise ValueError(
                 f"Unknown tool: {tool_name}. "
                 f"Available tools: {list(self.tool_registry.keys())}"
             )
-        
-        # Determine whether to use direct or proxy endpoint
-        if use_direct is None:
-            use_direct = getattr(self.config, 'use_direct_tool_calls', True)
-        
-        # Check if tool is forced to use proxy
-        force_proxy_tools = getattr(self.config, 'force_proxy_tools', [])
-        if tool_name in force_proxy_tools:
-            use_direct = False
-            logger.debug(f"Tool {tool_name} forced to use proxy")
-        
-        tool_info = self.tool_registry[tool_name]
-        
-        # Choose endpoint
-        if use_direct:
-            if not tool_info["direct_endpoint"]:
-                logger.warning(
-                    f"Tool {tool_name} has no direct endpoint, falling back to proxy"
-                )
-                endpoint = tool_info["proxy_endpoint"]
-                call_type = "proxy (fallback)"
-            else:
-                endpoint = tool_info["direct_endpoint"]
-                call_type = "direct"
-        else:
-            endpoint = tool_info["proxy_endpoint"]
-            call_type = "proxy"
+        endpoint, call_type = route
         
         logger.info(f"Invoking tool: {tool_name} ({call_type})")
         logger.debug(f"Endpoint: {endpoint}")
         logger.debug(f"Tool input: {tool_input}")
         
         try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.post(
-                    endpoint,
-                    json=tool_input,
-                    timeout=self.config.timeout
-                )
-                response.raise_for_status()
-                result = response.json()
+            response = await self._http.post(
+                endpoint,
+                json=tool_input,
+                timeout=self.config.timeout
+            )
+            response.raise_for_status()
+            result = _json_loads(response.content)
             
             logger.info(f"Tool {tool_name} executed successfully ({call_type})")
             logger.debug(f"Tool result: {result}")
@@ -182,6 +267,27 @@ class MCPAgent:
             logger.error(f"Tool execution failed for {tool_name} ({call_type}): {e}")
             raise
     
+    def _resolve_endpoint(
+        self,
+        tool_name: str,
+        tool_info: Dict,
+        use_direct: bool
+    ) -> Tuple[str, str]:
+        """Pick the endpoint for a tool, returning (endpoint, call_type)"""
+        # Check if tool is forced to use proxy
+        if tool_name in self.config._force_proxy_set:
+            logger.debug(f"Tool {tool_name} forced to use proxy")
+            return tool_info["proxy_endpoint"], "proxy"
+
+        if not use_direct:
+            return tool_info["proxy_endpoint"], "proxy"
+
+        if not tool_info["direct_endpoint"]:
+            logger.warning(f"Tool {tool_name} has no direct endpoint, falling back to proxy")
+            return tool_info["proxy_endpoint"], "proxy (fallback)"
+
+        return tool_info["direct_endpoint"], "direct"
+    
     def get_available_tools(self) -> Dict[str, str]:
         """Return a dict of available tools and their descriptions"""
         return {
@@ -190,16 +296,26 @@ class MCPAgent:
         }
     
     def _convert_tools_for_anthropic(self) -> List[Dict]:
-        """Convert OpenAI format tools to Anthropic format"""
-        anthropic_tools = []
-        for tool in self.tools:
-            func = tool.get('function', {})
-            anthropic_tools.append({
-                "name": func.get('name'),
-                "description": func.get('description'),
-                "input_schema": func.get('parameters', {})
-            })
-        return anthropic_tools
+        """Convert the tool registry to Anthropic format, sharing the parameter schemas"""
+        return [
+            {
+                "name": name,
+                "description": info["description"],
+                "input_schema": info["parameters"] or {}
+            }
+            for name, info in self.tool_registry.items()
+        ]
+
+    def _convert_tools_for_openai(self) -> List[Dict]:
+        """Convert tools to OpenAI Responses API format"""
+        return [
+            {
+                "type": tool["type"],
+                "name": tool["function"]["name"],  # Add name at top level
+                "function": tool["function"]
+            }
+            for tool in self.tools
+        ]
     
     async def _call_anthropic(self, messages: List[Dict], 
                              use_tools: bool = True, 
@@ -215,13 +331,9 @@ class MCPAgent:
             kwargs["system"] = system_prompt
         
         if use_tools and self.tools:
-            kwargs["tools"] = self._convert_tools_for_anthropic()
+            kwargs["tools"] = self._anthropic_tools
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, 
-            lambda: self.anthropic_client.messages.create(**kwargs)
-        )
+        return await self.anthropic_client.messages.create(**kwargs)
     
     async def _call_openai(
         self,
@@ -229,16 +341,16 @@ class MCPAgent:
         use_tools: bool = True,
         system_prompt: Optional[str] = None
     ) -> Any:
-        """Call OpenAI Responses API"""
-        input_messages = []
+        """
+        Call OpenAI Responses API
 
+        Callers that keep the system message pinned in ``messages`` (as run()
+        does) should omit system_prompt so the history is passed without a copy.
+        """
         if system_prompt:
-            input_messages.append({
-                "role": "system",
-                "content": system_prompt
-            })
-
-        input_messages.extend(messages)
+            input_messages = [{"role": "system", "content": system_prompt}, *messages]
+        else:
+            input_messages = messages
 
         kwargs = {
             "model": self.model,
@@ -247,24 +359,10 @@ class MCPAgent:
         }
 
         if use_tools and self.tools:
-            # Transform tools for OpenAI format
-            openai_tools = []
-            for tool in self.tools:
-                openai_tool = {
-                    "type": tool["type"],
-                    "name": tool["function"]["name"],  # Add name at top level
-                    "function": tool["function"]
-                }
-                openai_tools.append(openai_tool)
-            
-            kwargs["tools"] = openai_tools
+            kwargs["tools"] = self._openai_tools
             kwargs["tool_choice"] = "auto"
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.openai_client.responses.create(**kwargs)
-        )
+        return await self.openai_client.responses.create(**kwargs)
     
     async def _call_ollama(self, prompt: str, use_tools: bool = True) -> Dict:
         """Call Ollama with tools support"""
@@ -277,18 +375,13 @@ class MCPAgent:
         if use_tools and self.tools:
             payload["tools"] = self.tools
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._sync_call_ollama, payload)
-    
-    def _sync_call_ollama(self, payload: Dict) -> Dict:
-        """Synchronous Ollama call"""
-        response = requests.post(
-            self.config.ollama_url, 
+        response = await self._http.post(
+            self.config.ollama_url,
             json=payload,
             timeout=self.config.timeout
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     async def run(self, userid: str, user_message: str, verbose: bool = True) -> str:
         """
@@ -297,15 +390,13 @@ class MCPAgent:
         Args:
             userid: User identifier
             user_message: The user's query
-            verbose: Whether to print debug information
+            verbose: Whether to log per-iteration progress (query, tool calls, answer)
             
         Returns:
             The final response from the agent
         """
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"🤖 Query: {user_message} userId {userid}")
-            print(f"{'='*60}\n")
+            logger.info(f"\n{'='*60}\n🤖 Query: {user_message} userId {userid}\n{'='*60}")
         
         # Discover tools if not already loaded
         if not self.tools:
@@ -314,10 +405,14 @@ class MCPAgent:
         user_message = userid + " " + user_message
         
         messages = [{"role": "user", "content": user_message}]
+
+        # Pin the OpenAI system message once instead of prepending it every turn
+        if self.config.provider == LLMProvider.OPENAI and self.config.system_prompt:
+            messages.insert(0, {"role": "system", "content": self.config.system_prompt})
         
         for iteration in range(self.config.max_iterations):
             if verbose:
-                print(f"🔄 Iteration {iteration + 1}/{self.config.max_iterations}")
+                logger.info(f"🔄 Iteration {iteration + 1}/{self.config.max_iterations}")
             
             # Call LLM based on provider
             if self.config.provider == LLMProvider.ANTHROPIC:
@@ -334,70 +429,71 @@ class MCPAgent:
                     input_tokens = response.usage.input_tokens
                     output_tokens = response.usage.output_tokens
                     total_tokens = input_tokens + output_tokens
-                    print(f"📊 Anthropic tokens | input={input_tokens}, output={output_tokens}, total={total_tokens}")
+                    logger.info(f"📊 Anthropic tokens | input={input_tokens}, output={output_tokens}, total={total_tokens}")
+
+                # Single pass over the content blocks
+                tool_use_blocks = []
+                text_block = None
+                for block in response.content:
+                    block_type = block.type
+                    if block_type == "tool_use":
+                        tool_use_blocks.append(block)
+                    elif block_type == "text" and text_block is None:
+                        text_block = block
 
                 if response.stop_reason == "tool_use":
-                    tool_use_block = next(
-                        (block for block in response.content if block.type == "tool_use"),
-                        None
-                    )
-                    
-                    if tool_use_block:
+                    if tool_use_blocks:
                         if verbose:
-                            print(f"  🔧 Calling: {tool_use_block.name}")
-                            print(f"     Params: {json.dumps(tool_use_block.input, indent=2)}")
-                        
-                        try:
-                            result = await self.invoke_tool(
-                                tool_use_block.name, 
-                                tool_use_block.input
-                            )
-                            
-                            if verbose:
-                                print(f"  ✅ Result: {json.dumps(result, indent=2)[:200]}...")
-                            
-                            messages.append({
-                                "role": "assistant",
-                                "content": response.content
-                            })
-                            
-                            messages.append({
-                                "role": "user",
-                                "content": [{
+                            for block in tool_use_blocks:
+                                logger.info(f"🔧 Calling: {block.name} | Params: {_json_dumps(block.input)}")
+
+                        # Claude may request several tools in one turn; run them concurrently
+                        results = await asyncio.gather(
+                            *(self.invoke_tool(block.name, block.input) for block in tool_use_blocks),
+                            return_exceptions=True
+                        )
+
+                        tool_results = []
+                        for block, result in zip(tool_use_blocks, results):
+                            if isinstance(result, BaseException):
+                                if verbose:
+                                    logger.info(f"❌ Error: {str(result)}")
+                                tool_results.append({
                                     "type": "tool_result",
-                                    "tool_use_id": tool_use_block.id,
-                                    "content": json.dumps(result)
-                                }]
-                            })
-                            
-                            continue
-                            
-                        except Exception as e:
-                            if verbose:
-                                print(f"  ❌ Error: {str(e)}")
-                            messages.append({
-                                "role": "user",
-                                "content": f"Tool failed: {str(e)}"
-                            })
-                            continue
+                                    "tool_use_id": block.id,
+                                    "content": f"Tool failed: {str(result)}",
+                                    "is_error": True
+                                })
+                            else:
+                                if verbose:
+                                    logger.info(f"✅ Result: {_json_dumps(result)[:200]}...")
+                                tool_results.append({
+                                    "type": "tool_result",
+                                    "tool_use_id": block.id,
+                                    "content": _json_dumps(result)
+                                })
+
+                        messages.append({
+                            "role": "assistant",
+                            "content": response.content
+                        })
+
+                        messages.append({
+                            "role": "user",
+                            "content": tool_results
+                        })
+
+                        continue
                 
                 elif response.stop_reason == "end_turn":
-                    text_block = next(
-                        (block for block in response.content if block.type == "text"),
-                        None
-                    )
                     if text_block:
                         final_response = text_block.text
                         if verbose:
-                            print(f"\n✅ Answer: {final_response}\n")
+                            logger.info(f"✅ Answer: {final_response}")
                         return final_response
             
             elif self.config.provider == LLMProvider.OPENAI:
-                response = await self._call_openai(
-                    messages,
-                    use_tools=True,
-                    system_prompt=self.config.system_prompt
-                )
+                response = await self._call_openai(messages, use_tools=True)
                 logger.debug(f"OpenAI response: {response}")
                 
                 # Token logging
@@ -405,64 +501,59 @@ class MCPAgent:
                     prompt_tokens = response.usage.input_tokens
                     completion_tokens = response.usage.output_tokens
                     total_tokens = response.usage.total_tokens
-                    print(f"📊 OpenAI tokens | prompt={prompt_tokens}, completion={completion_tokens}, total={total_tokens}")
+                    logger.info(f"📊 OpenAI tokens | prompt={prompt_tokens}, completion={completion_tokens}, total={total_tokens}")
                 
                 # Get output from Responses API (not choices)
                 output = response.output[0]  # Changed from response.choices[0].message
                 
                 # Check if output is a function call (tool call)
-                if hasattr(output, 'type') and output.type == 'function':
+                if getattr(output, 'type', None) == 'function_call':
                     # output itself IS the tool call
                     tool_name = output.name
-                    tool_args = output.arguments if isinstance(output.arguments, dict) else json.loads(output.arguments)                
+                    tool_args = output.arguments if isinstance(output.arguments, dict) else _json_loads(output.arguments)                
                     if verbose:
-                        print(f"  🔧 Calling: {tool_name}")
-                        print(f"     Params: {json.dumps(tool_args, indent=2)}")
+                        logger.info(f"🔧 Calling: {tool_name} | Params: {_json_dumps(tool_args)}")
                     
                     try:
                         result = await self.invoke_tool(tool_name, tool_args)
                         
                         if verbose:
-                            print(f"  ✅ Result: {json.dumps(result, indent=2)[:200]}...")
+                            logger.info(f"✅ Result: {_json_dumps(result)[:200]}...")
                         
-                        # Add assistant's tool call to messages
+                        # Add the model's tool call to the input, linked by call_id
                         messages.append({
-                            "role": "assistant",
-                            "content": output.content,  # Changed from message.content
-                            "tool_calls": [{
-                                "id": tool_call.id,
-                                "type": "function",
-                                "function": {
-                                    "name": tool_name,
-                                    "arguments": tool_call.function.arguments
-                                }
-                            }]
+                            "type": "function_call",
+                            "call_id": output.call_id,
+                            "name": tool_name,
+                            "arguments": output.arguments
                         })
                         
                         # Add tool result
                         messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": json.dumps(result)
+                            "type": "function_call_output",
+                            "call_id": output.call_id,
+                            "output": _json_dumps(result)
                         })
                         
                         continue
                         
                     except Exception as e:
                         if verbose:
-                            print(f"  ❌ Error: {str(e)}")
+                            logger.info(f"❌ Error: {str(e)}")
                         messages.append({
                             "role": "user",
                             "content": f"Tool failed: {str(e)}"
                         })
                         continue
-                
-        else:
-        # No tool call - return final response
-            final_response = output  # Changed from message.content
-            if verbose:
-                print(f"\n✅ Answer: {final_response}\n")
-                return final_response
+
+                else:
+                    # No tool call - return final response
+                    content = getattr(output, "content", None)
+                    final_response = content[0].text if content else str(output)
+                    if verbose:
+                        logger.info(f"✅ Answer: {final_response}")
+                    return final_response
+
             elif self.config.provider == LLMProvider.OLLAMA:
                 prompt = messages[-1]["content"]
                 response = await self._call_ollama(prompt, use_tools=True)
@@ -474,12 +565,12 @@ class MCPAgent:
                     tool_params = tool_call['function']['arguments']
                     
                     if verbose:
-                        print(f"  🔧 Calling: {tool_name}")
+                        logger.info(f"🔧 Calling: {tool_name}")
                     
                     try:
                         result = await self.invoke_tool(tool_name, tool_params)
                         
-                        final_prompt = f"""Tool '{tool_name}' returned: {json.dumps(result)}
+                        final_prompt = f"""Tool '{tool_name}' returned: {_json_dumps(result)}
 Based on this, answer: "{user_message}"
 Provide a natural language response."""
                         
@@ -487,17 +578,17 @@ Provide a natural language response."""
                         final_response = final_response_data.get('message', {}).get('content', '')
                         
                         if verbose:
-                            print(f"\n✅ Answer: {final_response}\n")
+                            logger.info(f"✅ Answer: {final_response}")
                         return final_response
                         
                     except Exception as e:
                         if verbose:
-                            print(f"  ❌ Error: {str(e)}")
+                            logger.info(f"❌ Error: {str(e)}")
                         return f"Tool execution failed: {str(e)}"
                 else:
                     content = message.get('content', '')
                     if verbose:
-                        print(f"\n✅ Answer: {content}\n")
+                        logger.info(f"✅ Answer: {content}")
                     return content
         
         return "Max iterations reached"
\ No newline at end of file
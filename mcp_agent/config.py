@@ -1,16 +1,16 @@
 """Configuration for MCP Agent"""
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, FrozenSet
 import logging
 import os
-import sys
-from pathlib import Path
+import httpx
 
-# Add parent directory to path to import central config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from .service_config import load_env_once
+from .llogger import setup_logger, get_output_handlers
 
-from .llogger import setup_logger
+# Make .env values visible to the AgentConfig defaults below
+load_env_once()
 
 def print_color(msg, color="yellow", bold=True):
     colors = {"red": "\033[91m", "green": "\033[92m", "yellow": "\033[93m", "blue": "\033[94m",
@@ -25,7 +25,7 @@ def print_color(msg, color="yellow", bold=True):
 def print_logfile_name(logger):
     """Finds the first FileHandler in the logger and prints its base filename."""
     found = False
-    for handler in logger.handlers:
+    for handler in get_output_handlers(logger):
         if isinstance(handler, logging.FileHandler):
             print_color(f"LOGGING TO FILE: {handler.baseFilename}", "blue")
             found = True
@@ -34,10 +34,13 @@ def print_logfile_name(logger):
     if not found:
         print_color("WARNING: No FileHandler found. Logging to console only.", "yellow")
 
-logger = setup_logger(__name__)
-print_logfile_name(logger)
+def init_logging():
+    """Set up the package logger and report where it writes; call once at startup"""
+    logger = setup_logger("mcp_agent")
+    print_logfile_name(logger)
+    return logger
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for MCP Agent"""
 
@@ -56,10 +59,15 @@ class AgentConfig:
     max_iterations: int = 5
     max_tokens: int = 1024
     timeout: int = 300
+    cache_tools: bool = True  # Persist the tool catalog on disk and revalidate it via ETag
+
+    # Shared connection pool for MCP and Ollama calls (owned by the caller)
+    http_client: Optional[httpx.AsyncClient] = field(default=None, repr=False)
     
     # Tool calling behavior (NEW)
     use_direct_tool_calls: bool = True  # Default to direct calls
     force_proxy_tools: List[str] = field(default_factory=list)  # Tools that must use proxy
+    _force_proxy_set: FrozenSet[str] = field(init=False, repr=False, default=frozenset())
     
     # System prompt
     system_prompt: str = """You are a helpful assistant with access to user data tools.
@@ -70,4 +78,8 @@ use the lookup_user_data tool with query='car_details'.
 When users ask about orders or purchases, use query='recent_orders'.
 When users ask about account or profile info, use query='profile'.
 
-After retrieving data, provide helpful analysis and recommendations based on the data."""
\ No newline at end of file
+After retrieving data, provide helpful analysis and recommendations based on the data."""
+
+    def __post_init__(self):
+        # O(1) membership checks for force_proxy_tools on every tool call
+        self._force_proxy_set = frozenset(self.force_proxy_tools)
@@ -1,9 +1,77 @@
 # logger.py
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
 
+# Records are queued by the caller and written by one background thread,
+# so request handlers never block on stdout or the log file.
+_log_queue = queue.Queue(-1)
+_listener = None
 
-import sys
+# Caller lookup (funcName/lineno) walks the stack for every record, so it is
+# only done when the debug log file is switched on
+DEBUG_LOG_FILE = os.getenv("LOG_DEBUG_FILE", "").lower() in ("1", "true", "yes")
+
+
+def _skip_find_caller(stack_info=False, stacklevel=1):
+    """Logger.findCaller replacement that skips the stack walk"""
+    return "(unknown file)", 0, "(unknown function)", None
+
+
+def _get_listener() -> QueueListener:
+    """Create and start the shared listener that owns the real handlers"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    short_format = logging.Formatter(
+        '%(asctime)s - PID:%(process)d - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    # Console handler (prints to terminal)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(short_format)
+
+    # File handler (appends to file). Service workers all share this file, so
+    # rotation is left to an external tool such as logrotate; the handler
+    # reopens the file once it has been moved away
+    file_handler = WatchedFileHandler('mcp_agent.log')
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(short_format)
+
+    handlers = [console_handler, file_handler]
+
+    # Debug file handler with caller details, only when LOG_DEBUG_FILE is set
+    if DEBUG_LOG_FILE:
+        debug_handler = WatchedFileHandler('mcp_agent.debug.log')
+        debug_handler.setLevel(logging.DEBUG)
+        debug_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - PID:%(process)d - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        handlers.append(debug_handler)
+
+    _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # Drain whatever is still queued when the process exits
+    atexit.register(_listener.stop)
+    return _listener
+
+
+def get_output_handlers(logger: logging.Logger) -> list:
+    """Return the handlers that actually write a logger's records"""
+    handlers = []
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler) and handler.queue is _log_queue:
+            handlers.extend(_get_listener().handlers)
+        else:
+            handlers.append(handler)
+    return handlers
 
 def set_terminal_title(title):
     # \033]0; is the start sequence for setting the title
@@ -13,15 +81,18 @@ def set_terminal_title(title):
 
 def setup_logger(name: str = "mcp_agent", level: str = "INFO"):
     """
-    Setup a logger with console and file output
+    Setup a logger with console and file output.
+
+    The logger only enqueues records; a shared background listener formats
+    them and writes to the console and file.
 
     Log format includes:
     - %(asctime)s: Timestamp
     - %(process)d: Process ID
     - %(name)s: Logger name
     - %(levelname)s: Log level (INFO, DEBUG, etc.)
-    - %(funcName)s: Function name (file logs only)
-    - %(lineno)d: Line number (file logs only)
+    - %(funcName)s: Function name (debug file only, LOG_DEBUG_FILE=1)
+    - %(lineno)d: Line number (debug file only, LOG_DEBUG_FILE=1)
     - %(message)s: Actual log message
 
     Args:
@@ -37,27 +108,13 @@ def setup_logger(name: str = "mcp_agent", level: str = "INFO"):
     if logger.handlers:
         return logger
     
-    # Console handler (prints to terminal)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter(
-        '%(asctime)s - PID:%(process)d - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(console_format)
-
-    # File handler (saves to file)
-    file_handler = logging.FileHandler('mcp_agent.log')
-    file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
-        '%(asctime)s - PID:%(process)d - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_format)
-    
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    _get_listener()
+    logger.addHandler(QueueHandler(_log_queue))
+    # The listener is the only writer; don't also hand records to root
+    # handlers (FastMCP installs a synchronous stderr one)
+    logger.propagate = False
+    if not DEBUG_LOG_FILE:
+        logger.findCaller = _skip_find_caller
     
     return logger
 
@@ -0,0 +1,116 @@
+"""
+Centralized configuration for all services in the MCP Agent system.
+
+This file defines ports, URLs, and other settings that can be overridden
+via environment variables.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from pathlib import Path
+
+@lru_cache(maxsize=1)
+def load_env_once() -> None:
+    """Load the project .env file; repeat calls are no-ops"""
+    try:
+        from dotenv import load_dotenv
+        # Load from .env file in the project root
+        env_path = Path(__file__).parent.parent / ".env"
+        load_dotenv(dotenv_path=env_path)
+    except ImportError:
+        # python-dotenv not installed, skip
+        pass
+
+
+load_env_once()
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceConfig:
+    """Centralized configuration for all services (snapshot of the environment)"""
+
+    # Service Ports
+    MCP_SERVER_PORT: int
+    USER_DETAILS_PORT: int
+    WHATSAPP_BOT_PORT: int
+    AGENT_PROXY_PORT: int
+
+    # Service URLs (constructed from ports)
+    MCP_SERVER_URL: str
+    USER_DETAILS_URL: str
+    AGENT_PROXY_URL: str
+
+    # Ollama Configuration
+    OLLAMA_HOST: str
+    OLLAMA_PORT: int
+    OLLAMA_URL: str
+    OLLAMA_GENERATE_URL: str
+
+    # Twilio Configuration (loaded from environment)
+    TWILIO_ACCOUNT_SID: Optional[str]
+    TWILIO_AUTH_TOKEN: Optional[str]
+    TWILIO_WHATSAPP_NUMBER: str
+    TWILIO_SANDBOX_CODE: str
+
+    # LLM API Keys
+    ANTHROPIC_API_KEY: Optional[str]
+    OPENAI_API_KEY: Optional[str]
+
+    # Default LLM Provider (0=Ollama, 1=Anthropic, 2=OpenAI)
+    DEFAULT_LLM_PROVIDER: int
+
+    # Logging
+    LOG_LEVEL: str
+    LOG_DIR: str
+
+    # Uvicorn worker processes per FastAPI service
+    SERVICE_WORKERS: int
+
+    @classmethod
+    def _from_env(cls) -> "ServiceConfig":
+        """Read the environment once and build a config instance"""
+        env = dict(os.environ)
+
+        mcp_server_port = int(env.get("MCP_SERVER_PORT", "3333"))
+        user_details_port = int(env.get("USER_DETAILS_PORT", "8001"))
+        agent_proxy_port = int(env.get("AGENT_PROXY_PORT", "8000"))
+        ollama_host = env.get("OLLAMA_HOST", "localhost")
+        ollama_port = int(env.get("OLLAMA_PORT", "11434"))
+
+        return cls(
+            MCP_SERVER_PORT=mcp_server_port,
+            USER_DETAILS_PORT=user_details_port,
+            WHATSAPP_BOT_PORT=int(env.get("WHATSAPP_BOT_PORT", "5000")),
+            AGENT_PROXY_PORT=agent_proxy_port,
+            MCP_SERVER_URL=f"http://localhost:{mcp_server_port}",
+            USER_DETAILS_URL=f"http://localhost:{user_details_port}",
+            AGENT_PROXY_URL=f"http://localhost:{agent_proxy_port}",
+            OLLAMA_HOST=ollama_host,
+            OLLAMA_PORT=ollama_port,
+            OLLAMA_URL=f"http://{ollama_host}:{ollama_port}/api/chat",
+            OLLAMA_GENERATE_URL=f"http://{ollama_host}:{ollama_port}/api/generate",
+            TWILIO_ACCOUNT_SID=env.get("TWILIO_ACCOUNT_SID"),
+            TWILIO_AUTH_TOKEN=env.get("TWILIO_AUTH_TOKEN"),
+            TWILIO_WHATSAPP_NUMBER=env.get("TWILIO_WHATSAPP_NUMBER", "whatsapp:+14155238886"),
+            TWILIO_SANDBOX_CODE=env.get("TWILIO_SANDBOX_CODE", "join learn-is"),
+            ANTHROPIC_API_KEY=env.get("ANTHROPIC_API_KEY"),
+            OPENAI_API_KEY=env.get("OPENAI_API_KEY"),
+            DEFAULT_LLM_PROVIDER=int(env.get("DEFAULT_LLM_PROVIDER", "1")),
+            LOG_LEVEL=env.get("LOG_LEVEL", "INFO"),
+            LOG_DIR=env.get("LOG_DIR", "logs"),
+            SERVICE_WORKERS=int(env.get("SERVICE_WORKERS") or os.cpu_count() or 1),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ServiceConfig:
+    """Get the global configuration instance, built on first use"""
+    return ServiceConfig._from_env()
+
+
+def reload_config() -> ServiceConfig:
+    """Reload configuration from environment variables"""
+    get_config.cache_clear()
+    return get_config()
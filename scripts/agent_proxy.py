@@ -5,25 +5,44 @@ This service provides a REST API interface to the MCP Agent with support for
 multiple LLM providers (Ollama, Anthropic, OpenAI).
 """
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
+import httpx
 import os
 import sys
-from pathlib import Path
+import uuid
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import get_config
+from mcp_agent.service_config import get_config, reload_config
 from mcp_agent import MCPAgent, AgentConfig, LLMProvider
-from mcp_agent.llogger import set_terminal_title
+from mcp_agent.llogger import setup_logger, set_terminal_title
 
 # Initialize configuration
 config = get_config()
 
+logger = setup_logger(__name__)
+
+# One connection pool per worker, shared by every cached agent
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await http_client.aclose()
+
+
 # Initialize FastAPI app
-app = FastAPI(title="MCPAgent HTTP Wrapper")
+app = FastAPI(
+    title="MCPAgent HTTP Wrapper",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # LLM Provider mapping: 0=Ollama, 1=Anthropic (default), 2=OpenAI
 LLM_MAP = {
@@ -34,33 +53,37 @@ LLM_MAP = {
 
 llm_selected = config.DEFAULT_LLM_PROVIDER
 
-# Global agent dictionary to cache agents per LLM type
-agents = {}
+
+# ANSI color codes and the precomputed (color, bold) -> prefix table
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+}
+_RESET = "\033[0m"
+_PREFIX = {
+    (color, bold): ("\033[1m" if bold else "") + code
+    for color, code in _COLORS.items()
+    for bold in (True, False)
+}
 
 
 def print_color(msg, color="yellow", bold=True):
     """Print colored console output"""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
-        "reset": "\033[0m"
-    }
-
-    color_code = colors.get(color.lower(), colors["yellow"])
-    bold_code = "\033[1m" if bold else ""
-    reset = colors["reset"]
-
-    print(f"{bold_code}{color_code}{msg}{reset}")
+    bold = bool(bold)
+    prefix = _PREFIX.get((color.lower(), bold)) or _PREFIX[("yellow", bold)]
+    sys.stdout.write(prefix + str(msg) + _RESET + "\n")
+    sys.stdout.flush()
 
 
+@lru_cache(maxsize=3)
 def get_agent(llm: int = 1) -> MCPAgent:
     """
-    Get or create an agent for the specified LLM provider.
+    Get or create an agent for the specified LLM provider (cached per llm).
 
     Args:
         llm: 0=Ollama, 1=Anthropic (default), 2=OpenAI
@@ -73,10 +96,6 @@ def get_agent(llm: int = 1) -> MCPAgent:
             f"Invalid LLM value: {llm}. Must be 0 (Ollama), 1 (Anthropic), or 2 (OpenAI)"
         )
 
-    # Return cached agent if exists
-    if llm in agents:
-        return agents[llm]
-
     # Create new agent
     provider, api_key_env, default_model = LLM_MAP[llm]
 
@@ -91,11 +110,11 @@ def get_agent(llm: int = 1) -> MCPAgent:
         mcp_server_url=config.MCP_SERVER_URL,
         provider=provider,
         model=default_model,
-        api_key=api_key
+        api_key=api_key,
+        http_client=http_client
     )
 
     agent = MCPAgent(agent_config)
-    agents[llm] = agent  # Cache it
 
     print(f"✅ Initialized {provider} agent with model {default_model}")
     return agent
@@ -139,12 +158,15 @@ async def generate(request: GenerateRequest):
     except ValueError as e:
         # Invalid LLM value or missing API key
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        # Log the error and return a 500 status code if the agent fails
-        print(f"❌ Agent Error: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        # The traceback goes to the log through the queue listener; the client
+        # only gets an id to correlate with it, never the exception text
+        request_id = uuid.uuid4().hex
+        logger.exception(f"Agent error (request_id={request_id})")
+        raise HTTPException(
+            status_code=500,
+            detail={"error": "Agent error", "request_id": request_id}
+        )
 
 
 @app.get("/llm-info")
@@ -197,7 +219,21 @@ def main():
 
     set_terminal_title(f"MCPAgent Proxy port {port} - LLM: {LLM_MAP[llm_selected][0]}")
 
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Workers re-import this module, so hand them the LLM choice via the environment.
+    # With one worker that import happens in this process, where get_config() is
+    # already cached, so rebuild it from the updated environment first
+    os.environ["DEFAULT_LLM_PROVIDER"] = str(llm_selected)
+    reload_config()
+
+    uvicorn.run(
+        "scripts.agent_proxy:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=config.SERVICE_WORKERS,
+        log_level="warning"
+    )
 
 
 if __name__ == "__main__":
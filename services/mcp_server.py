@@ -4,73 +4,81 @@ MCP Server - FastAPI server that provides tool discovery and invocation endpoint
 This server exposes tools via HTTP endpoints in OpenAI/Ollama function calling format.
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
+from pydantic import BaseModel, ConfigDict, RootModel
+from typing import Any, Dict
 import uvicorn
-import sys
-from pathlib import Path
+import hashlib
+import orjson
+import types
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import get_config
+from mcp_agent.service_config import get_config
+from mcp_agent.llogger import setup_logger
 
 # Initialize configuration
 config = get_config()
 
+logger = setup_logger(__name__)
+
 # Initialize MCP server
 mcp = FastMCP("my-data-connector")
 
 
-# Register tool
-@mcp.tool(
-    name="lookup_user_data",
-    description="Fetch user-specific data including car details, orders, profile information, etc."
-)
+# Simulated user data, built once and shared read-only by every request
+_MOCK_DATA = types.MappingProxyType({
+    "car_details": {
+        "make": "Mazda",
+        "model": "MX-5 Grand Touring",
+        "year": 2021,
+        "color": "Gray Metallic",
+        "registration": "PA-01-AB-1234"
+    },
+    "recent_orders": [
+        {"order_id": "12345", "item": "Product A", "date": "2026-01-01"},
+        {"order_id": "12346", "item": "Product B", "date": "2026-01-03"}
+    ],
+    "profile": {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "address": "123 Main St"
+    }
+})
+
+
 async def lookup_user_data(msisdn: str, query: str) -> dict:
     """
     Args:
         msisdn: The phone number of the user (e.g., +919916103095)
         query: The type of data to retrieve (e.g., 'car_details', 'recent_orders', 'profile')
     """
-    print(f"Looking up data for MSISDN: {msisdn}, Query: {query}")
-
-    # Simulate data lookup
-    mock_data = {
-        "car_details": {
-            "make": "Mazda",
-            "model": "MX-5 Grand Touring",
-            "year": 2021,
-            "color": "Gray Metallic",
-            "registration": "PA-01-AB-1234"
-        },
-        "recent_orders": [
-            {"order_id": "12345", "item": "Product A", "date": "2026-01-01"},
-            {"order_id": "12346", "item": "Product B", "date": "2026-01-03"}
-        ],
-        "profile": {
-            "name": "John Doe",
-            "email": "john@example.com",
-            "address": "123 Main St"
-        }
-    }
+    logger.info(f"Looking up data for MSISDN: {msisdn}, Query: {query}")
 
     return {
         "msisdn": msisdn,
         "query": query,
-        "result": mock_data.get(query, f"No data found for query: {query}")
+        "result": _MOCK_DATA.get(query, f"No data found for query: {query}")
     }
 
 
-app = FastAPI()
-
+# Register tools. The HTTP routes run these same Tool objects, so arguments go
+# through FastMCP's validation on both paths
+_TOOLS = (
+    Tool.from_function(
+        lookup_user_data,
+        name="lookup_user_data",
+        description="Fetch user-specific data including car details, orders, profile information, etc."
+    ),
+)
+for _tool in _TOOLS:
+    mcp.add_tool(_tool.fn, name=_tool.name, description=_tool.description)
 
-# ---- TOOL DISCOVERY (HTTP) ----
-@app.get("/tools")
-async def list_tools():
-    """Return tools in OpenAI/Ollama function calling format"""
-    tools_list = await mcp.list_tools()
 
+def format_tools_openai(tools_list) -> list:
+    """Convert MCP tools to OpenAI/Ollama function calling format"""
     result = []
 
     for tool in tools_list:
@@ -82,7 +90,7 @@ async def list_tools():
             "type": "function",
             "function": {
                 "name": tool.name,
-                "description": tool.description or f"Tool: {tool.name}",
+                "description": tool.description or "",
                 "parameters": {
                     "type": "object",
                     "properties": schema.get("properties", {}),
@@ -96,12 +104,8 @@ async def list_tools():
     return result
 
 
-# ---- SIMPLIFIED SCHEMA ENDPOINT (optional) ----
-@app.get("/tools/simple")
-async def list_tools_simple():
-    """Return tools in simplified format"""
-    tools_list = await mcp.list_tools()
-
+def format_tools_simple(tools_list) -> list:
+    """Convert MCP tools to the simplified schema format"""
     result = []
 
     for tool in tools_list:
@@ -125,28 +129,91 @@ async def list_tools_simple():
     return result
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Format the tool catalog once; the registered tools are fixed for the process"""
+    tools_list = await mcp.list_tools()
+    # Dispatch table for call_tool, keyed by what MCP actually serves: every tool
+    # in the catalog must be callable over HTTP, so refuse to start on drift
+    tools_by_name = {t.name: t for t in _TOOLS}
+    missing = [t.name for t in tools_list if t.name not in tools_by_name]
+    if missing:
+        raise RuntimeError(f"Tools registered with MCP but missing from _TOOLS: {', '.join(missing)}")
+    app.state.tool_registry = {t.name: tools_by_name[t.name] for t in tools_list}
+    # Serialized once; the endpoints hand these bytes straight to the response
+    app.state.tools_bytes = orjson.dumps(format_tools_openai(tools_list))
+    app.state.tools_simple_bytes = orjson.dumps(format_tools_simple(tools_list))
+    app.state.tools_etag = f'"{hashlib.sha256(app.state.tools_bytes).hexdigest()[:32]}"'
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+# ---- TOOL DISCOVERY (HTTP) ----
+@app.get("/tools")
+async def list_tools(request: Request):
+    """
+    Return tools in OpenAI/Ollama function calling format.
+
+    The response carries an ETag; clients sending a matching If-None-Match
+    get a 304 so they can reuse their cached catalog.
+    """
+    etag = app.state.tools_etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=app.state.tools_bytes,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
+
+
+# ---- SIMPLIFIED SCHEMA ENDPOINT (optional) ----
+@app.get("/tools/simple")
+async def list_tools_simple():
+    """Return tools in simplified format"""
+    return Response(content=app.state.tools_simple_bytes, media_type="application/json")
+
+
 # ---- TOOL INVOCATION (HTTP) ----
-@app.post("/tools/{tool_name}")
-async def call_tool(tool_name: str, payload: dict):
-    """Invoke a tool with given parameters"""
+class LookupPayload(BaseModel):
+    """Arguments for lookup_user_data"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+    msisdn: str
+    query: str
+
+
+class ToolPayload(RootModel[Dict[str, Any]]):
+    """Arguments for tools without a dedicated payload model"""
+
+
+async def _invoke_tool(tool_name: str, arguments: dict):
+    """Run a registered tool and map failures to HTTP errors"""
+    tool = app.state.tool_registry.get(tool_name)
+    if tool is None:
+        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
     try:
-        result = await mcp.call_tool(tool_name, payload)
-        return result
-    except AttributeError:
-        # Fallback if call_tool doesn't exist
-        try:
-            # Try using the tool directly
-            tool_func = getattr(mcp, tool_name, None)
-            if tool_func:
-                return await tool_func(**payload)
-            else:
-                raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        return await tool.run(arguments)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# Declared before the generic route so known tools get their typed payload
+@app.post("/tools/lookup_user_data")
+async def call_lookup_user_data(payload: LookupPayload):
+    """Invoke lookup_user_data with a validated payload"""
+    return await _invoke_tool("lookup_user_data", payload.model_dump())
+
+
+@app.post("/tools/{tool_name}")
+async def call_tool(tool_name: str, payload: ToolPayload):
+    """Invoke a tool with given parameters"""
+    return await _invoke_tool(tool_name, payload.root)
+
+
 # ---- HEALTH CHECK ----
 @app.get("/")
 async def health():
@@ -160,7 +227,15 @@ def main():
     print(f"Starting MCP server on http://0.0.0.0:{port}")
     print(f"Tools endpoint: http://0.0.0.0:{port}/tools")
 
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        "services.mcp_server:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=config.SERVICE_WORKERS,
+        log_level="warning"
+    )
 
 
 if __name__ == "__main__":
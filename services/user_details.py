@@ -5,25 +5,47 @@ This service can be called directly or via the MCP server proxy.
 """
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 import uvicorn
-import sys
-from pathlib import Path
+import types
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import get_config
+from mcp_agent.service_config import get_config
+from mcp_agent.llogger import setup_logger
 
 # Initialize configuration
 config = get_config()
 
-app = FastAPI()
+logger = setup_logger(__name__)
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+# Simulated user data, built once and shared read-only by every request
+_MOCK_DATA = types.MappingProxyType({
+    "car_details": {
+        "make": "Mazda",
+        "model": "MX-5 Grand Touring",
+        "year": 2021,
+        "color": "Gray Metallic",
+        "registration": "PA-01-AB-1234"
+    },
+    "recent_orders": [
+        {"order_id": "12345", "item": "Product A", "date": "2026-01-01"},
+        {"order_id": "12346", "item": "Product B", "date": "2026-01-03"}
+    ],
+    "profile": {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "address": "123 Main St"
+    }
+})
 
 
 # Define request model for JSON body
 class LookupUserDataRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     msisdn: str
     query: str
 
@@ -39,32 +61,12 @@ async def lookup_user_data(request: LookupUserDataRequest):
     msisdn = request.msisdn
     query = request.query
 
-    print(f"Looking up data for MSISDN: {msisdn}, Query: {query}")
-
-    # Simulate data lookup
-    mock_data = {
-        "car_details": {
-            "make": "Mazda",
-            "model": "MX-5 Grand Touring",
-            "year": 2021,
-            "color": "Gray Metallic",
-            "registration": "PA-01-AB-1234"
-        },
-        "recent_orders": [
-            {"order_id": "12345", "item": "Product A", "date": "2026-01-01"},
-            {"order_id": "12346", "item": "Product B", "date": "2026-01-03"}
-        ],
-        "profile": {
-            "name": "John Doe",
-            "email": "john@example.com",
-            "address": "123 Main St"
-        }
-    }
+    logger.info(f"Looking up data for MSISDN: {msisdn}, Query: {query}")
 
     return {
         "msisdn": msisdn,
         "query": query,
-        "result": mock_data.get(query, f"No data found for query: {query}"),
+        "result": _MOCK_DATA.get(query, f"No data found for query: {query}"),
         "service": "user_details"
     }
 
@@ -88,7 +90,15 @@ def main():
     except ImportError:
         pass
 
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        "services.user_details:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=config.SERVICE_WORKERS,
+        log_level="warning"
+    )
 
 
 if __name__ == "__main__":
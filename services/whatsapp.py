@@ -1,24 +1,31 @@
 """
-WhatsApp Bot Service - Flask application for handling WhatsApp messages via Twilio.
+WhatsApp Bot Service - handles WhatsApp messages via Twilio.
+
+The /webroot webhook and the outbound send routes are async FastAPI routes;
+the remaining utility routes are the original Flask app, mounted underneath it.
 
 This service integrates with the MCP agent to provide AI-powered WhatsApp bot functionality.
 """
 
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, BackgroundTasks
+from fastapi.middleware.wsgi import WSGIMiddleware
+from fastapi.responses import PlainTextResponse
 from flask import Flask, request
 from twilio.rest import Client
-import signal
+from twilio.http.async_http_client import AsyncTwilioHttpClient
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 import sys
 import os
 from pathlib import Path
+from platformdirs import user_cache_dir
 import pyttsx3
-import requests
+import httpx
+import uvicorn
 import asyncio
-import time
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import get_config
+from mcp_agent.service_config import get_config
 from mcp_agent import MCPAgent
 
 # Initialize configuration
@@ -29,8 +36,12 @@ if not config.TWILIO_ACCOUNT_SID or not config.TWILIO_AUTH_TOKEN:
     print("ERROR: TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN must be set in environment variables")
     sys.exit(1)
 
-# Initialize Twilio client
-client = Client(config.TWILIO_ACCOUNT_SID, config.TWILIO_AUTH_TOKEN)
+# Twilio client (async transport, used with the *_async methods). Created in the
+# lifespan: AsyncTwilioHttpClient opens an aiohttp session, which needs uvicorn's loop
+client = None
+
+# Caps concurrent Twilio sends per process, for rate-limited accounts
+_send_limit = asyncio.Semaphore(2)
 
 # Globals
 log_file = "twilio.log"
@@ -40,6 +51,36 @@ status_num = 0
 ob_num = 0
 mcp_agent = None
 
+# Shared pooled client for Ollama calls
+_http_client = httpx.AsyncClient(
+    timeout=60,  # httpx's 5s default is far too short for LLM generation
+    limits=httpx.Limits(max_keepalive_connections=50)
+)
+
+# TTS synthesis runs off the event loop. pyttsx3 hands out one engine per
+# process and it is not thread-safe, so a single worker serializes synthesis.
+_tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+TTS_CACHE_DIR = Path(user_cache_dir("mcp_agent")) / "tts"
+TTS_CACHE_MAX_FILES = 500
+
+@asynccontextmanager
+async def lifespan(api: FastAPI):
+    global client
+    client = Client(
+        config.TWILIO_ACCOUNT_SID,
+        config.TWILIO_AUTH_TOKEN,
+        http_client=AsyncTwilioHttpClient()
+    )
+    yield
+    await client.http_client.close()
+    await _http_client.aclose()
+    # uvicorn owns SIGINT/SIGTERM, so shutdown cleanup runs here
+    house_cleaning()
+
+
+# Async webhook app; the legacy Flask routes are mounted under it at the bottom
+api = FastAPI(lifespan=lifespan)
+
 app = Flask(__name__)
 app.debug = True
 
@@ -54,12 +95,10 @@ def create_mcp_agent():
     return agent
 
 
-def generate(prompt, model="mistral:latest", max_tokens=50, temperature=0.7):
+async def generate(prompt, model="mistral:latest", max_tokens=50, temperature=0.7):
     """
     Call Ollama/Mistral and return generated text or full response.
     """
-    SERVER_URL = config.OLLAMA_URL.replace("/api/chat", "/api/generate")
-
     jsonNew = {
         "model": model,
         "prompt": prompt,
@@ -75,7 +114,7 @@ def generate(prompt, model="mistral:latest", max_tokens=50, temperature=0.7):
     }
     log(f"ollama- <{jsonNew}>")
 
-    resp = requests.post(SERVER_URL, json=jsonNew)
+    resp = await _http_client.post(config.OLLAMA_GENERATE_URL, json=jsonNew)
 
     data = resp.json()
     log(f"response- <{data}>")
@@ -95,10 +134,47 @@ def doTTS(msg, tofile):
     speaker.setProperty('rate', 150)
     speaker.setProperty('volume', 1.0)
     try:
-        speaker.say(msg)
         speaker.save_to_file(msg, tofile)
-    except:
-        print("Error in TTS")
+        speaker.runAndWait()
+    except Exception as e:
+        log(f"Error in TTS: {e}")
+
+
+def _evict_tts_cache():
+    """Drop the oldest cached audio files once the cache is over its limit"""
+    files = sorted(TTS_CACHE_DIR.glob("*.wav"), key=lambda f: f.stat().st_mtime)
+    for old in files[:max(0, len(files) - TTS_CACHE_MAX_FILES)]:
+        old.unlink(missing_ok=True)
+
+
+def _synth_to_cache(msg, path):
+    """Synthesize into a temp file and move it into place once complete"""
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    doTTS(msg, str(tmp_path))
+    if tmp_path.exists():
+        os.replace(tmp_path, path)
+        _evict_tts_cache()
+
+
+async def do_tts(msg):
+    """
+    Return the path of a WAV file speaking msg, synthesizing it only on a cache miss.
+    Returns None if synthesis failed.
+
+    Files are keyed by a hash of the message, so repeated replies (greetings,
+    errors) are served from disk.
+    """
+    TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    key = blake2b(msg.encode(), digest_size=16).hexdigest()
+    path = TTS_CACHE_DIR / f"{key}.wav"
+    if path.exists():
+        log(f"do_tts cache hit <{path}>")
+        return path
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_tts_pool, _synth_to_cache, msg, path)
+    # doTTS logs and swallows engine errors, so check the file actually landed
+    return path if path.exists() else None
 
 
 def log(*args):
@@ -109,15 +185,9 @@ def log(*args):
     print(msg, file=log_fh, flush=True)
 
 
-def signal_handler(sig, frame):
-    """Handle interrupt signals"""
-    house_cleaning(sig)
-    sys.exit(0)
-
-
-def house_cleaning(sig: int):
+def house_cleaning():
     """Cleanup resources on shutdown"""
-    log(f'Signal {sig} received, cleaning up')
+    log('Shutting down, cleaning up')
     if log_fh is not sys.stdout:
         log_fh.close()
         print("Closed log file")
@@ -156,10 +226,12 @@ def hello():
     }
 
 
-def send_tts_message(msg, recp):
+async def send_tts_message(msg, recp):
     """Send a message with TTS media"""
     log(f"\tsend_tts_message <{recp}> to <{msg}>")
-    resp = client.messages.create(
+    # Still a fixed media URL: do_tts writes local WAV files, but Twilio needs a
+    # public URL and WhatsApp does not accept WAV audio, so it is not wired in yet
+    resp = await client.messages.create_async(
         media_url=['https://channels.kirusa.com/webplay/b2ff37a28db425f6efb65e4e67363539/'],
         from_=config.TWILIO_WHATSAPP_NUMBER,
         to=recp
@@ -167,8 +239,8 @@ def send_tts_message(msg, recp):
     log(resp)
 
 
-def send_message(msg, recp):
-    """Send a WhatsApp message, splitting if too long"""
+async def send_message(msg, recp):
+    """Send a WhatsApp message, splitting if too long; parts are sent concurrently"""
     log(f"\tsend_message to <{recp}>")
 
     if not msg or not recp:
@@ -184,33 +256,32 @@ def send_message(msg, recp):
         chunks = [msg]
 
     log(f"\tSending {len(chunks)} message(s)...")
-    responses = []
 
-    for i, chunk in enumerate(chunks):
+    async def send_part(i, chunk):
         try:
             # Add part number if multiple chunks
             body = f"({i + 1}/{len(chunks)})\n{chunk}" if len(chunks) > 1 else chunk
 
-            resp = client.messages.create(
-                body=body,
-                from_=config.TWILIO_WHATSAPP_NUMBER,
-                to=recp
-            )
+            async with _send_limit:
+                resp = await client.messages.create_async(
+                    body=body,
+                    from_=config.TWILIO_WHATSAPP_NUMBER,
+                    to=recp
+                )
             log(f"\t✅ Part {i + 1} sent! SID: {resp.sid}")
-            responses.append(resp)
-
-            # Delay between messages
-            if i < len(chunks) - 1:
-                time.sleep(1)
+            return resp
 
         except Exception as e:
             log(f"\t❌ ERROR: {e}")
             raise
 
+    # gather keeps the responses in part order
+    responses = await asyncio.gather(*(send_part(i, chunk) for i, chunk in enumerate(chunks)))
+
     return responses[0] if len(responses) == 1 else responses
 
 
-def process_message(msg: str, name: str):
+async def process_message(msg: str, name: str):
     """Process incoming message and generate response"""
     if msg.casefold() == "hi":
         message = f"{name}, welcome to the car help bot. Send your car issue and I will try to help you"
@@ -221,9 +292,9 @@ def process_message(msg: str, name: str):
         log(f"For user {name} will get answer for <{msg}> from LLM")
         if mcp_agent is None:
             log("Error: MCP agent not initialized")
-            message = generate(msg, 501)
+            message = await generate(msg, 501)
         else:
-            message = asyncio.run(mcp_agent.run(name, msg))
+            message = await mcp_agent.run(name, msg)
 
     return message
 
@@ -247,29 +318,38 @@ def isTwilio(form):
     return ispresent != deflv
 
 
-@app.route("/webroot", methods=["POST"])
-def webroot():
-    """Main webhook endpoint for incoming WhatsApp messages"""
+@api.post("/webroot")
+async def webroot(req: Request, background: BackgroundTasks):
+    """
+    Main webhook endpoint for incoming WhatsApp messages.
+
+    The agent runs on the server's event loop; Twilio sends happen as
+    background tasks so the webhook is acknowledged immediately.
+    """
     num = incMsg()
     loghdr("webroot", num, True)
 
-    form = request.form
-    loghttp(request)
+    body = await req.body()
+    form = await req.form()
+    log("type-", req.method)
+    log("args-", req.query_params)
+    log("forms-", form)
+    log("get_data--> {0}".format(body))
     sender = form["From"]
     msg = form["Body"]
     name = sender
-    message = process_message(msg, name)
+    message = await process_message(msg, name)
 
     loghdr("webroot", num, False)
 
     if message == "media":
-        send_tts_message(msg, sender)
-        return "OK", 200
+        background.add_task(send_tts_message, msg, sender)
+        return PlainTextResponse("OK")
 
     if isTwilio(form):  # twilio
         log(f"sending msg <{message}> to <{sender}>")
-        send_message(message, sender)
-        return "OK", 200
+        background.add_task(send_message, message, sender)
+        return PlainTextResponse("OK")
     else:
         return {
             "Result": message
@@ -286,14 +366,14 @@ def status():
     return "OK", 200
 
 
-@app.route("/sendmessage", methods=["POST", "GET"])
-def sendmessage():
+@api.api_route("/sendmessage", methods=["POST", "GET"])
+async def sendmessage(req: Request):
     """Send outbound message"""
     num = incObd()
     msg = ""
     loghdr("outbound", num, True)
     try:
-        form = request.form
+        form = await req.form()
         log(form)
         msg = form
     except:
@@ -305,21 +385,21 @@ def sendmessage():
     recp = form["sendto"]
     message = form["message"]
     for num in recp.split(","):
-        msg = send_message(message, f"WhatsApp:+{num.strip()}")
+        msg = await send_message(message, f"WhatsApp:+{num.strip()}")
     return {
-        "Result": msg
+        "Result": str(msg)
     }
 
 
-@app.route("/sendinvite", methods=["POST", "GET"])
-def sendinvite():
+@api.api_route("/sendinvite", methods=["POST", "GET"])
+async def sendinvite(req: Request):
     """Send bot invitation"""
     message = f"whatsapp://send?phone={config.TWILIO_WHATSAPP_NUMBER}&text={config.TWILIO_SANDBOX_CODE}"
     num = incObd()
 
     loghdr("invite", num, True)
     try:
-        form = request.form
+        form = await req.form()
         log(form)
     except:
         log("error, could not get data from body")
@@ -328,9 +408,9 @@ def sendinvite():
     loghdr("invite", num, False)
     recp = form["sendto"]
     for num in recp.split(","):
-        msg = send_message(message, f"WhatsApp:+{num.strip()}")
+        msg = await send_message(message, f"WhatsApp:+{num.strip()}")
     return {
-        "Result": msg
+        "Result": str(msg)
     }
 
 
@@ -373,6 +453,10 @@ def loghttp(req):
     log("get_data--> {0}".format(req.get_data()))
 
 
+# Everything not handled by the async routes above goes to the Flask app
+api.mount("/", WSGIMiddleware(app))
+
+
 def main():
     """Entry point for WhatsApp bot service"""
     global log_fh, mcp_agent
@@ -389,13 +473,12 @@ def main():
         log_fh = open(log_file_path, 'w')
 
     print(f"Starting WhatsApp bot on port {server_port}")
-    print("Adding signal handler ... ")
-    signal.signal(signal.SIGINT, signal_handler)
 
     # Create MCP agent
     mcp_agent = create_mcp_agent()
 
-    app.run(host='localhost', port=server_port, debug=True, use_reloader=False)
+    # Single worker: the agent and message counters live in this process
+    uvicorn.run(api, host="localhost", port=server_port, loop="uvloop", http="httptools")
 
 
 if __name__ == "__main__":